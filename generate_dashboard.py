@@ -16,6 +16,12 @@ Options:
     -t, --templates PATH  Folder containing template part files (default: ./Templates)
     -o, --output PATH     Output HTML file path (default: local directory)
     -p, --publish         Publish to SharePoint instead of local directory
+    -s, --split           Write a stable shell HTML plus a separate, content-hashed data file
+    -f, --fast            Fast start: read CSVs with the csv module, never import pandas
+    --benchmark           Time the fast path against the pandas path and compare records
+                          (synthetic data in both column formats, plus the input CSVs if present)
+    --memory-check        Check peak memory against MEMORY_BUDGET_MB with 500k synthetic items
+                          (with --fast / --split for the fast path / split output)
     -h, --help            Show this help message
 
 Workflow:
@@ -38,15 +44,25 @@ Examples:
     # Custom output path
     python3 generate_dashboard.py -o ~/Documents/test-dashboard.html
 
+    # Split output: shell HTML is only rewritten when templates change,
+    # data is published as a small content-hashed .js file next to it
+    python3 generate_dashboard.py --publish --split
+
 Requirements:
-    - pandas
+    - pandas (not needed with --fast, which uses the standard library csv module)
     - Template files: dashboard_v3_part1.html through part4.html (in Templates folder)
 """
 
-import pandas as pd
 import json
 import re
 import os
+import csv
+import math
+import hashlib
+import glob
+import shutil
+import tempfile
+from urllib.parse import quote
 import sys
 import argparse
 import time
@@ -68,17 +84,65 @@ DEFAULT_TEMPLATE_DIR = './Templates'
 LOCAL_OUTPUT_PATH = '/Users/tonythem/GitHub/athemelis/eSHARE-DevOps-Dashboard/eSHARE-DevOps-Dashboard.html'
 PUBLISH_OUTPUT_PATH = '/Users/tonythem/Library/CloudStorage/OneDrive-SharedLibraries-e-Share/Product Management - Documents/Product Planning/eSHARE-DevOps-Dashboard.html'
 
-CURRENT_VERSION = 100  # Increment this with each code change
+CURRENT_VERSION = 104  # Increment this with each code change
 
 # Placeholders that MUST be replaced
 PLACEHOLDERS = {
     'WORK_ITEMS_PLACEHOLDER': 'Work items data array',
     'REFRESH_TIMESTAMP_PLACEHOLDER': 'Refresh timestamp string',
     'ORG_CHART_DATA_PLACEHOLDER': 'Org chart data array',
+    'ORG_CHART_INDEX_PLACEHOLDER': 'Org chart team/member/alias lookup maps',
     'CSV_VALIDATION_DATA_PLACEHOLDER': 'CSV validation metadata',
     'WORK_ITEM_LINKS_PLACEHOLDER': 'Work item links data array'
 }
 
+# Org_Chart.csv columns
+ORG_CHART_COLUMNS = ['Lead', 'Formal Name', 'Common Name', 'Team', 'Status']
+
+# Strings pandas.read_csv() treats as missing by default. The fast (csv module) path
+# uses the same set so both paths produce identical records.
+CSV_NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+])
+
+# Peak memory budget (--memory-check): peak RSS of a full run over MEMORY_CHECK_ITEMS
+# synthetic work items must stay under MEMORY_BUDGET_MB, in single-file and split mode.
+# Reference run (v104, Python 3.11, pandas 3.0, Linux): fast 457 MB single / 469 MB split,
+# pandas 500 MB single / 504 MB split.
+# Before WorkItemTable + streamed output (v103): fast 5,083 MB, pandas 4,454 MB.
+MEMORY_CHECK_ITEMS = 500_000
+MEMORY_BUDGET_MB = {'fast': 600, 'pandas': 640}
+
+# Synthetic work items per column format compared by --benchmark
+BENCHMARK_ITEMS = 5_000
+
+# Split output mode (--split)
+# The shell HTML references the data through this global instead of inline JSON.
+# Output files, for an output path of <dir>/<name>.html:
+#   <dir>/<name>.html                 Shell (template + CSS + JS), rewritten only when it changes
+#   <dir>/<name>.data.js              Tiny pointer to the latest data file, loaded with cache-busting
+#   <dir>/<name>.data.<hash>.js       Content-hashed data file, immutable once written
+DATA_GLOBAL = 'DASHBOARD_DATA'
+DATA_FILES_TO_KEEP = 3  # Keep a few previous data files for viewers mid-load
+
+# Each reference falls back to empty data, so a data file that failed to load leaves the
+# views empty (with the "data not available" banner) instead of a script error in every view
+SHELL_DATA = f'(window.{DATA_GLOBAL} || {{}})'
+SHELL_PLACEHOLDERS = {
+    'WORK_ITEMS_PLACEHOLDER': f'({SHELL_DATA}.workItems || [])',
+    'ORG_CHART_DATA_PLACEHOLDER': f'({SHELL_DATA}.orgChartData || [])',
+    'ORG_CHART_INDEX_PLACEHOLDER': f'({SHELL_DATA}.orgChartIndex || {{ teams: {{}}, members: {{}}, aliases: {{}} }})',
+    'CSV_VALIDATION_DATA_PLACEHOLDER': (
+        f'({SHELL_DATA}.csvValidationData || {{ total: 0, byType: {{}}, byState: {{}}, byTeam: {{}}, '
+        f'dateRange: {{ earliest: null, latest: null }}, uniqueIds: 0, duplicateIds: 0 }})'
+    ),
+    'WORK_ITEM_LINKS_PLACEHOLDER': f'({SHELL_DATA}.workItemLinks || [])',
+    'REFRESH_TIMESTAMP_PLACEHOLDER': (
+        f"<script>document.currentScript.parentNode.textContent = {SHELL_DATA}.refreshTimestamp || '';</script>"
+    )
+}
+
 
 def get_refresh_timestamp(csv_path=None):
     """Get refresh timestamp from CSV file's last modified date, formatted for 3 timezones.
@@ -112,9 +176,14 @@ def get_refresh_timestamp(csv_path=None):
         return f"Refreshed: {DATA_REFRESH_DATE} — Athens {athens_dt.strftime('%H:%M')} · Boston {boston_dt.strftime('%H:%M')} · Seattle {seattle_dt.strftime('%H:%M')}"
 
 
+def is_missing(val):
+    """Scalar pd.isna() without importing pandas: None or NaN."""
+    return val is None or (isinstance(val, float) and math.isnan(val))
+
+
 def clean_name(val):
     """Remove email addresses from name fields, return None for empty."""
-    if pd.isna(val) or str(val).strip() == '':
+    if is_missing(val) or str(val).strip() == '':
         return None
     val = str(val)
     val = re.sub(r'\s*<[^>]+>', '', val)
@@ -124,72 +193,252 @@ def clean_name(val):
 
 def clean_string(val):
     """Clean string value, return None for empty."""
-    if pd.isna(val):
+    if is_missing(val):
         return None
     val = str(val).strip()
     return val if val else None
 
 
+def normalize_team_name(team):
+    """Strip region suffixes like ' (US)' so 'Frontend (US)' and 'Frontend' share one key."""
+    return team.split(' (')[0].strip()
+
+
+# Literals as recognised by pandas.read_csv() dtype inference: numbers may be padded
+# with whitespace, inf/infinity and true/false are case-insensitive and never padded
+CSV_DEDUP_CACHE_SIZE = 10_000
+INT_PATTERN = re.compile(r'\s*[+-]?\d+\s*\Z', re.ASCII)
+FLOAT_PATTERN = re.compile(r'\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*\Z', re.ASCII)
+INF_PATTERN = re.compile(r'[+-]?inf(inity)?\Z', re.IGNORECASE)
+CSV_BOOL_VALUES = {'true': True, 'false': False}
+
+
+def read_csv_rows(csv_path, max_retries=5, retry_delay=5, as_columns=False):
+    """Read a CSV with the standard library csv module (fast path, no pandas import).
+
+    Returns (header, rows): rows are lists of raw strings padded to the header width,
+    with pandas' default missing-value strings (CSV_NA_VALUES) mapped to None.
+    With as_columns=True, returns (header, columns) instead, filled while reading so
+    no per-row lists are kept for large exports. Repeated values within a column share
+    one string object (like the pandas C parser), via a per-column cache that is reset
+    every CSV_DEDUP_CACHE_SIZE distinct values to bound its size on unique columns.
+    Same retry logic as the pandas readers for OneDrive/SharePoint file locks;
+    raises OSError after the last attempt.
+    """
+    for attempt in range(max_retries):
+        try:
+            with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                width = len(header)
+                columns = [[] for _ in header]
+                caches = [{} for _ in header]
+                rows = []
+                for row in reader:
+                    if not row:
+                        continue  # blank line (pandas skips these too)
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+                    values = [None if val in CSV_NA_VALUES else val for val in row[:width]]
+                    if as_columns:
+                        for column, cache, val in zip(columns, caches, values):
+                            if val is not None:
+                                if len(cache) >= CSV_DEDUP_CACHE_SIZE:
+                                    cache.clear()
+                                val = cache.setdefault(val, val)
+                            column.append(val)
+                    else:
+                        rows.append(values)
+            return header, columns if as_columns else rows
+        except OSError:
+            if attempt < max_retries - 1:
+                wait_time = retry_delay * (attempt + 1)  # Increasing delay
+                print(f"  File locked (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                time.sleep(wait_time)
+            else:
+                raise
+
+
+def coerce_csv_column(values):
+    """Convert a raw string column to int/float/bool the way pandas.read_csv() infers dtypes.
+
+    All-integer columns become int (float if any value is missing, like pandas int64 -> float64),
+    all-numeric columns (inf included) become float, all true/false columns become bool,
+    anything else is returned unchanged. This keeps clean_string() / clean_float() output
+    identical between paths, e.g. a Release Version column of "3.10" values reads as 3.1
+    and a true/false column reads as True/False (1.0/0.0 as a float).
+
+    Known difference: integers outside the int64/uint64 range, which pandas keeps as strings
+    or Python ints depending on the other values. ADO exports never contain them.
+    """
+    present = [val for val in values if val is not None]
+    if not present:
+        return values
+    if all(INT_PATTERN.match(val) for val in present):
+        convert = int if len(present) == len(values) else float
+    elif all(FLOAT_PATTERN.match(val) or INF_PATTERN.match(val) for val in present):
+        convert = float
+    elif all(val.lower() in CSV_BOOL_VALUES for val in present):
+        convert = lambda val: CSV_BOOL_VALUES[val.lower()]
+    else:
+        return values
+    return [None if val is None else convert(val) for val in values]
+
+
 def process_org_chart(csv_path):
     """
-    Process Org_Chart.csv and convert to the orgChartData format.
+    Process Org_Chart.csv and convert to the orgChartData format plus lookup index.
     
     CSV columns: Lead, Formal Name, Common Name, Team, Status
     
-    Output format:
+    Returns (org_chart_data, org_chart_index).
+
+    org_chart_data format:
     [
         { lead: 'Name', team: 'Team1 & Team2', members: [{ name: 'Name', team: 'Team', status: 'Status' }] },
         ...
     ]
+
+    org_chart_index format (direct lookups for the dashboard, no string splitting in JS):
+    {
+        teams:   { 'Frontend': { leads: ['Lead'], members: ['Active Name', ...],
+                                 capacityMembers: ['Lead', 'Active Name', ...], activeCount: 7 } },
+        members: { 'Name': { team: 'Frontend', lead: 'Lead', status: 'Employed' } },
+        aliases: { 'Formal Name': 'Common Name', 'Common Name': 'Common Name' }
+    }
+    Team keys are normalized (region suffix removed). capacityMembers = leads who manage only
+    that team + active members; activeCount is its length (the one team headcount for capacity). Alias keys match clean_name() output of assignedTo.
     """
     if not os.path.exists(csv_path):
         print(f"WARNING: Org chart CSV not found: {csv_path}")
-        return []
+        return [], build_org_chart_index([], {})
     
-    df = pd.read_csv(csv_path, encoding='utf-8-sig')
-    
-    # Group by Lead
-    grouped = {}
-    for _, row in df.iterrows():
-        lead = clean_string(row.get('Lead'))
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str)
+    df = df.reindex(columns=ORG_CHART_COLUMNS).astype('string')
+
+    # Vectorized clean_string(): strip whitespace, empty -> NA
+    df = df.apply(lambda col: col.str.strip().replace('', pd.NA))
+    df = df[df['Lead'].notna()]
+
+    df['Name'] = df['Common Name'].fillna(df['Formal Name'])
+    df['Status'] = df['Status'].fillna('Employed')
+    members = df[df['Name'].notna() & df['Team'].notna()]
+
+    # Combined team label per lead, e.g. "Analytics & Govern"
+    team_labels = members.groupby('Lead')['Team'].agg(lambda teams: ' & '.join(sorted(set(teams))))
+    lead_labels = {lead: team_labels.get(lead, 'Unknown') for lead in df['Lead'].unique()}
+
+    member_lists = {
+        lead: group[['Name', 'Team', 'Status']]
+            .rename(columns={'Name': 'name', 'Team': 'team', 'Status': 'status'})
+            .to_dict('records')
+        for lead, group in members.groupby('Lead', sort=False)
+    }
+
+    # Sorted by lead name for consistent output
+    result = [
+        {'lead': lead, 'team': lead_labels[lead], 'members': member_lists.get(lead, [])}
+        for lead in sorted(lead_labels)
+    ]
+
+    member_rows = members.astype(object).where(members.notna(), None).to_dict('records')
+    return result, build_org_chart_index(member_rows, lead_labels)
+
+
+def process_org_chart_fast(csv_path):
+    """Same output as process_org_chart(), using the csv module instead of pandas."""
+    if not os.path.exists(csv_path):
+        print(f"WARNING: Org chart CSV not found: {csv_path}")
+        return [], build_org_chart_index([], {})
+
+    header, rows = read_csv_rows(csv_path)
+    col_index = {name: header.index(name) for name in ORG_CHART_COLUMNS if name in header}
+
+    lead_labels = {}
+    member_lists = {}
+    member_rows = []
+    for row in rows:
+        cleaned = {name: clean_string(row[i]) for name, i in col_index.items()}
+        lead = cleaned.get('Lead')
         if not lead:
             continue
-        
-        if lead not in grouped:
-            grouped[lead] = {
-                'lead': lead,
-                'teams': set(),
-                'members': []
-            }
-        
-        member_name = clean_string(row.get('Common Name')) or clean_string(row.get('Formal Name'))
-        member_team = clean_string(row.get('Team'))
-        member_status = clean_string(row.get('Status')) or 'Employed'
-        
-        if member_name and member_team:
-            grouped[lead]['teams'].add(member_team)
-            grouped[lead]['members'].append({
-                'name': member_name,
-                'team': member_team,
-                'status': member_status
-            })
-    
-    # Convert to final format with combined team names
-    result = []
-    for lead, data in grouped.items():
-        teams_sorted = sorted(data['teams'])
-        team_label = ' & '.join(teams_sorted) if len(teams_sorted) > 1 else (teams_sorted[0] if teams_sorted else 'Unknown')
-        
-        result.append({
-            'lead': data['lead'],
-            'team': team_label,
-            'members': data['members']
-        })
-    
-    # Sort by lead name for consistent output
-    result.sort(key=lambda x: x['lead'])
+        lead_labels.setdefault(lead, set())
+        member_lists.setdefault(lead, [])
+
+        name = cleaned.get('Common Name') or cleaned.get('Formal Name')
+        team = cleaned.get('Team')
+        status = cleaned.get('Status') or 'Employed'
+        if name and team:
+            lead_labels[lead].add(team)
+            member_lists[lead].append({'name': name, 'team': team, 'status': status})
+            member_rows.append({'Lead': lead, 'Name': name, 'Formal Name': cleaned.get('Formal Name'),
+                                'Team': team, 'Status': status})
+
+    lead_labels = {lead: ' & '.join(sorted(teams)) if teams else 'Unknown' for lead, teams in lead_labels.items()}
+
+    result = [
+        {'lead': lead, 'team': lead_labels[lead], 'members': member_lists[lead]}
+        for lead in sorted(lead_labels)
+    ]
+
+    return result, build_org_chart_index(member_rows, lead_labels)
+
+
+def build_org_chart_index(member_rows, lead_labels):
+    """Build team/member/alias lookup maps from cleaned org chart member rows.
+
+    member_rows: [{ Lead, Name, Formal Name, Team, Status }] (members with a name and team)
+    lead_labels: { lead: combined team label }
+    """
+    lead_teams = {}
+    team_leads = {}
+    team_active = {}
+    for row in member_rows:
+        team = normalize_team_name(row['Team'])
+        lead_teams.setdefault(row['Lead'], set()).add(team)
+        # dicts as insertion-ordered sets
+        team_leads.setdefault(team, {})[row['Lead']] = None
+        active = team_active.setdefault(team, {})
+        if row['Status'] != 'Former':
+            active[row['Name']] = None
+
+    # Team headcount used by every capacity view (Teams, Roadmap, Tasks): active members plus
+    # leads who manage exactly one (normalized) team. A multi-team lead is not counted in any
+    # of their teams, so one person never adds capacity to two teams at once.
+    dedicated_leads = {lead for lead, teams in lead_teams.items() if len(teams) == 1}
+
+    teams = {}
+    for team in sorted(team_leads):
+        leads = list(team_leads[team])
+        active = list(team_active[team])
+        capacity_members = list(dict.fromkeys([lead for lead in leads if lead in dedicated_leads] + active))
+        teams[team] = {
+            'leads': leads,
+            'members': active,
+            'capacityMembers': capacity_members,
+            'activeCount': len(capacity_members)
+        }
+
+    # Leads map to their combined label; member rows (listed later) take precedence
+    member_index = {
+        lead: {'team': label, 'lead': lead, 'status': 'Employed'}
+        for lead, label in lead_labels.items()
+    }
+    member_index.update({
+        row['Name']: {'team': row['Team'], 'lead': row['Lead'], 'status': row['Status']}
+        for row in member_rows
+    })
+
+    # Formal and common names both resolve to the common name used everywhere in the dashboard
+    aliases = {name: name for name in member_index}
+    aliases.update(
+        (clean_name(row['Formal Name']), row['Name'])
+        for row in member_rows if row['Formal Name']
+    )
 
-    return result
+    return {'teams': teams, 'members': member_index, 'aliases': aliases}
 
 
 def process_work_item_links(csv_path, max_retries=5, retry_delay=5):
@@ -215,12 +464,14 @@ def process_work_item_links(csv_path, max_retries=5, retry_delay=5):
 
     print(f"Reading WorkItemLinks CSV: {csv_path}")
 
+    import pandas as pd
+
     # Retry logic for handling file locks
     df = None
     last_error = None
     for attempt in range(max_retries):
         try:
-            df = pd.read_csv(csv_path, encoding='utf-8-sig')
+            df = pd.read_csv(csv_path, encoding='utf-8-sig', float_precision='round_trip')
             break
         except OSError as e:
             last_error = e
@@ -242,31 +493,63 @@ def process_work_item_links(csv_path, max_retries=5, retry_delay=5):
 
     records = []
     for _, row in forward_links.iterrows():
-        source_id = int(row['SourceWorkItemId']) if pd.notna(row['SourceWorkItemId']) else None
-        target_id = int(row['TargetWorkItemId']) if pd.notna(row['TargetWorkItemId']) else None
+        record = build_link_record(lambda name, row=row: row.get(name))
+        if record:
+            records.append(record)
 
-        if source_id is None or target_id is None:
-            continue
+    return records
+
+
+def process_work_item_links_fast(csv_path, max_retries=5, retry_delay=5):
+    """Same records as process_work_item_links(), using the csv module instead of pandas."""
+    if not os.path.exists(csv_path):
+        print(f"WARNING: WorkItemLinks CSV not found: {csv_path}")
+        return []
+
+    print(f"Reading WorkItemLinks CSV (fast): {csv_path}")
+
+    try:
+        header, columns = read_csv_rows(csv_path, max_retries, retry_delay, as_columns=True)
+    except OSError:
+        print(f"WARNING: Could not read WorkItemLinks CSV after {max_retries} attempts")
+        return []
 
-        # Simplify LinkTypeName to just the core type
-        link_type_name = str(row.get('LinkTypeName', '')).strip()
-        # "Child" stays "Child", "Related" stays "Related"
+    print(f"Found {len(columns[0]) if columns else 0} link rows")
 
-        comment = clean_string(row.get('Comment', ''))
+    # Forward links only (LinkTypeId > 0), same as the pandas path
+    columns = [coerce_csv_column(values) for values in columns]
+    rows = [dict(zip(header, row)) for row in zip(*columns)]
+    forward_links = [row for row in rows if not is_missing(row['LinkTypeId']) and row['LinkTypeId'] > 0]
+    print(f"Filtered to {len(forward_links)} forward links (excluding reverse duplicates)")
 
-        records.append({
-            'source': source_id,
-            'target': target_id,
-            'type': link_type_name,
-            'comment': comment
-        })
+    records = []
+    for row in forward_links:
+        record = build_link_record(row.get)
+        if record:
+            records.append(record)
 
     return records
 
 
+def build_link_record(get_col):
+    """Build one link record. get_col(name) returns the raw column value (None if absent)."""
+    source_id = get_col('SourceWorkItemId')
+    target_id = get_col('TargetWorkItemId')
+    if is_missing(source_id) or is_missing(target_id):
+        return None
+
+    return {
+        'source': int(source_id),
+        'target': int(target_id),
+        # LinkTypeName is already the core type: "Child", "Related"
+        'type': clean_string(get_col('LinkTypeName')) or '',
+        'comment': clean_string(get_col('Comment'))
+    }
+
+
 def parse_datetime(val):
     """Parse datetime, return ISO format string or None."""
-    if pd.isna(val) or str(val).strip() == '':
+    if is_missing(val) or str(val).strip() == '':
         return None
     try:
         val_str = str(val).strip()
@@ -302,7 +585,7 @@ def parse_date_only(val):
 
     Used for: closedDate, targetDate, and any other date-only ADO fields.
     """
-    if pd.isna(val) or str(val).strip() == '':
+    if is_missing(val) or str(val).strip() == '':
         return None
     try:
         val_str = str(val).strip()
@@ -356,7 +639,7 @@ def parse_target_date(val):
 
 def clean_float(val):
     """Convert to float, return None for empty/invalid."""
-    if pd.isna(val):
+    if is_missing(val):
         return None
     try:
         f = float(val)
@@ -367,7 +650,7 @@ def clean_float(val):
 
 def clean_int(val):
     """Convert to int, return None for empty/invalid."""
-    if pd.isna(val):
+    if is_missing(val):
         return None
     try:
         i = int(float(val))
@@ -378,7 +661,7 @@ def clean_int(val):
 
 def get_team(area_path):
     """Extract team name from area path."""
-    if pd.isna(area_path):
+    if is_missing(area_path):
         return 'eShare'
     parts = str(area_path).split('\\')
     return parts[-1] if len(parts) > 1 else 'eShare'
@@ -386,25 +669,146 @@ def get_team(area_path):
 
 def get_iteration_name(iteration_path):
     """Extract iteration name from iteration path."""
-    if pd.isna(iteration_path):
+    if is_missing(iteration_path):
         return None
     parts = str(iteration_path).split('\\')
     return parts[-1] if parts else None
 
 
+# v45 SCHEMA - exact field names expected by dashboard JS
+# (field, converter, CSV column names): new ADO field names first, legacy friendly names as fallbacks.
+# 'url' is not stored; WorkItemTable derives it from 'id' on output.
+WORK_ITEM_SCHEMA = [
+    ('id', clean_int, ('System.Id', 'ID')),
+    ('type', clean_string, ('System.WorkItemType', 'Work Item Type')),
+    ('title', clean_string, ('System.Title', 'Title')),
+    ('state', clean_string, ('System.State', 'State')),
+    ('assignedTo', clean_name, ('System.AssignedTo', 'Assigned To')),
+    ('areaPath', clean_string, ('System.AreaPath', 'Area Path')),
+    ('team', get_team, ('System.AreaPath', 'Area Path')),
+    ('iterationPath', clean_string, ('System.IterationPath', 'Iteration Path')),
+    ('iteration', get_iteration_name, ('System.IterationPath', 'Iteration Path')),
+    ('createdDate', parse_datetime, ('System.CreatedDate', 'Created Date')),
+    ('stateChangeDate', parse_datetime, ('Microsoft.VSTS.Common.StateChangeDate', 'State Change Date')),
+    ('closedDate', parse_date_only, ('Microsoft.VSTS.Common.ClosedDate', 'Closed Date')),
+    ('targetDate', parse_target_date, ('Microsoft.VSTS.Scheduling.TargetDate', 'Target Date')),
+    ('priority', clean_int, ('Microsoft.VSTS.Common.Priority', 'Priority')),
+    ('severity', clean_string, ('Microsoft.VSTS.Common.Severity', 'Severity')),
+    ('tags', clean_string, ('System.Tags', 'Tags')),
+    ('parentId', clean_int, ('System.Parent', 'Parent')),
+    ('effort', clean_float, ('Microsoft.VSTS.Scheduling.Effort', 'Effort')),
+    ('effortRollup', lambda val: clean_float(val) or 0.0, ('Custom.EffortRollup', 'Effort Rollup')),
+    ('backlogPriority', clean_float, ('Microsoft.VSTS.Common.BacklogPriority', 'Backlog Priority')),
+    # Custom fields
+    ('customers', clean_string, ('Custom.Customers', 'Customers')),
+    ('teamsAffected', clean_string, ('Custom.TeamsAffected', 'Teams Affected')),
+    ('releaseVersion', clean_string, ('Custom.ReleaseVersion', 'Release Version')),
+    ('bugType', clean_string, ('Custom.BugType', 'Bug Type')),
+    ('component', clean_string, ('Custom.Component', 'Component')),
+    ('feature', clean_string, ('Custom.Feature', 'Feature')),
+    ('ticketCategory', clean_string, ('Custom.TicketCategory', 'Ticket Category')),
+    ('deliverySliceOwner', clean_name, ('Custom.DeliverySliceOwner', 'Delivery Slice Owner')),
+    ('csOwner', clean_name, ('Custom.CSOwner', 'CS Owner')),
+    ('workLogData', clean_string, ('Custom.WorkLogData', 'Work Log Data')),
+]
+
+# Low-cardinality string fields: each distinct value is stored once (sys.intern)
+INTERNED_FIELDS = {
+    'type', 'state', 'assignedTo', 'areaPath', 'team', 'iterationPath', 'iteration',
+    'closedDate', 'targetDate', 'severity', 'tags', 'customers', 'teamsAffected',
+    'releaseVersion', 'bugType', 'component', 'feature', 'ticketCategory',
+    'deliverySliceOwner', 'csOwner'
+}
+
+WORK_ITEM_URL = 'https://dev.azure.com/ncryptedcloud/eShare/_workitems/edit/{}'
+
+
+class WorkItemTable:
+    """Column-oriented store for processed work item records (v45 schema).
+
+    One list per field instead of one 31-key dict per work item, which keeps
+    multi-project exports with hundreds of thousands of items compact:
+    - repeated strings (type, state, team, names, dates...) are interned
+    - 'url' is derived from 'id' on output instead of being stored
+    Iterating yields the v45 record dicts; iter_json() streams the JSON array.
+    """
+    __slots__ = ('columns', 'length')
+
+    def __init__(self, columns, length):
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_columns(cls, get_column, length, release_column=None):
+        """Build the table from raw CSV columns.
+
+        get_column(*names) returns the raw values of the first column present,
+        or None if the CSV has none of them (every value is then treated as missing).
+        release_column(*names), if given, is called after the last field using those
+        columns so the caller can free the raw values early.
+        """
+        last_use = {names: field for field, _, names in WORK_ITEM_SCHEMA}
+        columns = {}
+        for field, convert, names in WORK_ITEM_SCHEMA:
+            raw = get_column(*names)
+            if raw is None:
+                raw = [None] * length
+            if field in INTERNED_FIELDS:
+                values = []
+                for val in raw:
+                    val = convert(val)
+                    values.append(sys.intern(val) if isinstance(val, str) else val)
+            else:
+                values = [convert(val) for val in raw]
+            columns[field] = values
+            del raw
+            if release_column and last_use[names] == field:
+                release_column(*names)
+        return cls(columns, length)
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def fields(self):
+        return list(self.columns) + ['url']
+
+    def column(self, field):
+        """Values of one field for all work items."""
+        if field == 'url':
+            return [WORK_ITEM_URL.format(work_item_id) for work_item_id in self.columns['id']]
+        return self.columns[field]
+
+    def __iter__(self):
+        fields = list(self.columns)
+        for values in zip(*self.columns.values()):
+            record = dict(zip(fields, values))
+            record['url'] = WORK_ITEM_URL.format(record['id'])
+            yield record
+
+    def iter_json(self):
+        """Yield the JSON array text record by record (same text as json.dumps(list(self)))."""
+        yield '['
+        for i, record in enumerate(self):
+            yield (', ' if i else '') + json.dumps(record)
+        yield ']'
+
+
 def process_csv(csv_path, max_retries=5, retry_delay=5):
-    """Process the CSV and return list of work item records matching v45 schema.
+    """Process the CSV and return a WorkItemTable of records matching v45 schema.
 
     Includes retry logic to handle file locks from OneDrive/SharePoint sync.
     """
     print(f"Reading CSV: {csv_path}")
 
+    import pandas as pd
+
     # Retry logic for handling file locks (OneDrive/SharePoint sync)
     df = None
     last_error = None
     for attempt in range(max_retries):
         try:
-            df = pd.read_csv(csv_path, encoding='utf-8-sig')
+            df = pd.read_csv(csv_path, encoding='utf-8-sig', float_precision='round_trip')
             break  # Success, exit retry loop
         except OSError as e:
             last_error = e
@@ -422,74 +826,92 @@ def process_csv(csv_path, max_retries=5, retry_delay=5):
     is_new_format = 'System.Id' in df.columns
     print(f"Column format: {'ADO Field Names (from PA)' if is_new_format else 'Friendly Names (legacy)'}")
     
-    def get_col(row, *possible_names):
-        """Get value from row, trying multiple possible column names."""
+    def get_column(*possible_names):
+        """Get column values as Python objects, trying multiple possible column names."""
         for name in possible_names:
-            if name in row.index:
-                return row[name]
+            if name in df.columns:
+                return df[name].tolist()
         return None
     
-    records = []
-    for idx, row in df.iterrows():
-        # v45 SCHEMA - exact field names expected by dashboard JS
-        # New ADO field names listed first, legacy friendly names as fallbacks
-        record = {
-            'id': clean_int(get_col(row, 'System.Id', 'ID')),
-            'type': clean_string(get_col(row, 'System.WorkItemType', 'Work Item Type')),
-            'title': clean_string(get_col(row, 'System.Title', 'Title')),
-            'state': clean_string(get_col(row, 'System.State', 'State')),
-            'assignedTo': clean_name(get_col(row, 'System.AssignedTo', 'Assigned To')),
-            'areaPath': clean_string(get_col(row, 'System.AreaPath', 'Area Path')),
-            'team': get_team(get_col(row, 'System.AreaPath', 'Area Path')),
-            'iterationPath': clean_string(get_col(row, 'System.IterationPath', 'Iteration Path')),
-            'iteration': get_iteration_name(get_col(row, 'System.IterationPath', 'Iteration Path')),
-            'createdDate': parse_datetime(get_col(row, 'System.CreatedDate', 'Created Date')),
-            'stateChangeDate': parse_datetime(get_col(row, 'Microsoft.VSTS.Common.StateChangeDate', 'State Change Date')),
-            'closedDate': parse_date_only(get_col(row, 'Microsoft.VSTS.Common.ClosedDate', 'Closed Date')),
-            'targetDate': parse_target_date(get_col(row, 'Microsoft.VSTS.Scheduling.TargetDate', 'Target Date')),
-            'priority': clean_int(get_col(row, 'Microsoft.VSTS.Common.Priority', 'Priority')),
-            'severity': clean_string(get_col(row, 'Microsoft.VSTS.Common.Severity', 'Severity')),
-            'tags': clean_string(get_col(row, 'System.Tags', 'Tags')),
-            'parentId': clean_int(get_col(row, 'System.Parent', 'Parent')),
-            'effort': clean_float(get_col(row, 'Microsoft.VSTS.Scheduling.Effort', 'Effort')),
-            'effortRollup': clean_float(get_col(row, 'Custom.EffortRollup', 'Effort Rollup')) or 0.0,
-            'backlogPriority': clean_float(get_col(row, 'Microsoft.VSTS.Common.BacklogPriority', 'Backlog Priority')),
-            # Custom fields
-            'customers': clean_string(get_col(row, 'Custom.Customers', 'Customers')),
-            'teamsAffected': clean_string(get_col(row, 'Custom.TeamsAffected', 'Teams Affected')),
-            'releaseVersion': clean_string(get_col(row, 'Custom.ReleaseVersion', 'Release Version')),
-            'bugType': clean_string(get_col(row, 'Custom.BugType', 'Bug Type')),
-            'component': clean_string(get_col(row, 'Custom.Component', 'Component')),
-            'feature': clean_string(get_col(row, 'Custom.Feature', 'Feature')),
-            'ticketCategory': clean_string(get_col(row, 'Custom.TicketCategory', 'Ticket Category')),
-            'deliverySliceOwner': clean_name(get_col(row, 'Custom.DeliverySliceOwner', 'Delivery Slice Owner')),
-            'csOwner': clean_name(get_col(row, 'Custom.CSOwner', 'CS Owner')),
-            'workLogData': clean_string(get_col(row, 'Custom.WorkLogData', 'Work Log Data')),
-            'url': f"https://dev.azure.com/ncryptedcloud/eShare/_workitems/edit/{clean_int(get_col(row, 'System.Id', 'ID'))}"
-        }
-        records.append(record)
+    def release_column(*possible_names):
+        """Drop DataFrame columns once every field using them has been converted."""
+        df.drop(columns=[name for name in possible_names if name in df.columns], inplace=True)
+
+    records = WorkItemTable.from_columns(get_column, len(df), release_column)
+
+    # Release the DataFrame as soon as it has been consumed (rebound, not deleted:
+    # the nested helpers above still reference the name)
+    df = None
+
+    return records
+
+
+def process_csv_fast(csv_path, max_retries=5, retry_delay=5):
+    """Same records as process_csv(), using the csv module instead of pandas.
+
+    Skips the pandas import and DataFrame construction, which dominate run time
+    for a few thousand rows. Column dtypes are inferred the way pandas does
+    (see coerce_csv_column) so both paths produce identical records.
+    """
+    print(f"Reading CSV (fast): {csv_path}")
+
+    try:
+        header, columns = read_csv_rows(csv_path, max_retries, retry_delay, as_columns=True)
+    except OSError:
+        print(f"ERROR: Could not read CSV after {max_retries} attempts")
+        raise
+
+    row_count = len(columns[0]) if columns else 0
+    print(f"Found {row_count} rows, {len(header)} columns")
+
+    # Detect which column naming convention is used
+    is_new_format = 'System.Id' in header
+    print(f"Column format: {'ADO Field Names (from PA)' if is_new_format else 'Friendly Names (legacy)'}")
+
+    # Raw columns by name; the first occurrence wins for duplicate headers (as in pandas)
+    raw_columns = {}
+    for name, values in zip(header, columns):
+        raw_columns.setdefault(name, values)
+    del columns
+
+    def get_column(*possible_names):
+        """Get coerced column values, trying multiple possible column names."""
+        for name in possible_names:
+            if name in raw_columns:
+                return coerce_csv_column(raw_columns[name])
+        return None
+
+    def release_column(*possible_names):
+        """Drop raw column values once every field using them has been converted."""
+        for name in possible_names:
+            raw_columns.pop(name, None)
+
+    records = WorkItemTable.from_columns(get_column, row_count, release_column)
+
+    # Release the raw columns as soon as they have been consumed
+    raw_columns = None
 
     return records
 
 
 def generate_csv_validation_data(records):
-    """Generate validation metadata from processed records for comparison in dashboard."""
+    """Generate validation metadata from processed records (WorkItemTable) for comparison in dashboard."""
     from collections import Counter
 
     # Total count
     total = len(records)
 
     # Count by type
-    type_counts = Counter(r['type'] for r in records if r.get('type'))
+    type_counts = Counter(t for t in records.column('type') if t)
 
     # Count by state
-    state_counts = Counter(r['state'] for r in records if r.get('state'))
+    state_counts = Counter(s for s in records.column('state') if s)
 
     # Count by team
-    team_counts = Counter(r['team'] for r in records if r.get('team'))
+    team_counts = Counter(t for t in records.column('team') if t)
 
     # Date range (created dates)
-    created_dates = [r['createdDate'] for r in records if r.get('createdDate')]
+    created_dates = [d for d in records.column('createdDate') if d]
     if created_dates:
         # Dates are in ISO format, so string comparison works
         min_date = min(created_dates)[:10]  # Just the date part
@@ -499,7 +921,7 @@ def generate_csv_validation_data(records):
         max_date = None
 
     # Unique IDs check
-    ids = [r['id'] for r in records if r.get('id')]
+    ids = [i for i in records.column('id') if i]
     unique_ids = len(set(ids))
     duplicate_ids = total - unique_ids
 
@@ -552,7 +974,7 @@ def validate_output(output):
 
 
 def validate_schema(records):
-    """Validate that records have the expected v45 schema fields."""
+    """Validate that records (WorkItemTable) have the expected v45 schema fields."""
     expected_fields = {
         'id', 'type', 'title', 'state', 'assignedTo', 'areaPath', 'team',
         'iterationPath', 'iteration', 'createdDate', 'stateChangeDate',
@@ -564,7 +986,7 @@ def validate_schema(records):
     }
     
     if records:
-        actual_fields = set(records[0].keys())
+        actual_fields = set(records.fields)
         missing = expected_fields - actual_fields
         extra = actual_fields - expected_fields
         
@@ -580,6 +1002,496 @@ def validate_schema(records):
     return False
 
 
+def write_text_file(path, content):
+    """Write content via a temp file + rename so viewers never see a half-written file.
+
+    content may be a string or an iterable of string chunks (streamed to disk, never
+    joined in memory). Returns the SHA-256 hex digest of the written text.
+    """
+    if isinstance(content, str):
+        content = (content,)
+    digest = hashlib.sha256()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for chunk in content:
+            f.write(chunk)
+            digest.update(chunk.encode('utf-8'))
+    os.replace(tmp_path, path)
+    return digest.hexdigest()
+
+
+def iter_json(value):
+    """Yield JSON text for value in chunks (same text as json.dumps(value)).
+
+    WorkItemTable values, also inside a dict, are streamed record by record so the
+    full work items JSON string is never held in memory.
+    """
+    if isinstance(value, WorkItemTable):
+        yield from value.iter_json()
+    elif isinstance(value, dict) and any(isinstance(item, WorkItemTable) for item in value.values()):
+        yield '{'
+        for i, (key, item) in enumerate(value.items()):
+            yield (', ' if i else '') + json.dumps(key) + ': '
+            yield from iter_json(item)
+        yield '}'
+    else:
+        yield json.dumps(value, indent=None)
+
+
+def render_template(template, replacements):
+    """Yield the template with every placeholder replaced, as a stream of chunks.
+
+    replacements maps placeholder -> callable returning an iterable of text chunks.
+    Equivalent to chained template.replace() calls, without building the output string.
+    """
+    pattern = re.compile('|'.join(re.escape(placeholder) for placeholder in replacements))
+    pos = 0
+    for match in pattern.finditer(template):
+        yield template[pos:match.start()]
+        yield from replacements[match.group(0)]()
+        pos = match.end()
+    yield template[pos:]
+
+
+def get_data_file_paths(output_path):
+    """Return (pointer_path, hashed_path_pattern) for the data files next to the shell HTML."""
+    stem = os.path.splitext(output_path)[0]
+    return f"{stem}.data.js", f"{stem}.data.{{hash}}.js"
+
+
+def build_shell(template, output_path):
+    """Build the stable shell HTML for split mode.
+
+    Placeholders are replaced with references to window.DASHBOARD_DATA, and a loader is
+    injected into <head> that pulls the pointer file with a cache-busting query string.
+    The pointer file then loads the content-hashed data file (cacheable forever).
+    The shell only depends on the templates and output file name, never on data.
+    """
+    pointer_path, _ = get_data_file_paths(output_path)
+    pointer_url = quote(os.path.basename(pointer_path))
+
+    # OneDrive/SharePoint may upload the pointer before the data file it names, and old data
+    # files are pruned, so a script that fails to load is retried once with a fresh ?v=.
+    # If the data still is not there, a banner asks the viewer to refresh later.
+    loader = f"""<script>
+    // Load latest data file (split mode) - pointer is cache-busted, data file is content-hashed
+    function loadDashboardScript(src, cacheBust, retried) {{
+        var url = cacheBust || retried ? src + '?v=' + Date.now() : src;
+        var onerror = retried
+            ? "console.error('Dashboard data: could not load " + src + "')"
+            : "loadDashboardScript('" + src + "', true, true)";
+        document.write('<script src="' + url + '" onerror="' + onerror + '"><\\/script>');
+    }}
+    document.addEventListener('DOMContentLoaded', function () {{
+        if (window.{DATA_GLOBAL}) return;
+        var banner = document.createElement('div');
+        banner.setAttribute('role', 'alert');
+        banner.style.cssText = 'padding: 12px 20px; background: #7f1d1d; color: #fff; text-align: center; font-weight: 600;';
+        banner.innerHTML = 'Dashboard data is not available yet (it may still be syncing). '
+            + '<a href="" style="color: inherit; text-decoration: underline;">Refresh</a> in a minute.';
+        document.body.insertBefore(banner, document.body.firstChild);
+    }});
+    loadDashboardScript('{pointer_url}', true, false);
+</script>
+"""
+
+    shell = template
+    for placeholder, replacement in SHELL_PLACEHOLDERS.items():
+        shell = shell.replace(placeholder, replacement)
+
+    if '</head>' not in shell:
+        print("ERROR: Template has no </head> tag - cannot inject data loader")
+        sys.exit(1)
+    return shell.replace('</head>', loader + '</head>', 1)
+
+
+def iter_data_script(data):
+    """Yield dashboard data as a JS file (window.DASHBOARD_DATA = {...};), in chunks."""
+    yield f"window.{DATA_GLOBAL} = "
+    for chunk in iter_json(data):
+        # '</' is escaped so data can never terminate the surrounding <script> element
+        # (chunks are whole JSON tokens, so '</' never spans two chunks)
+        yield chunk.replace('</', '<\\/')
+    yield ";\n"
+
+
+def write_split_output(template, data, output_path):
+    """Write shell HTML + pointer + content-hashed data file next to each other.
+
+    Write order matters: data file first, then pointer, then shell, so a viewer never
+    gets a pointer to a data file that does not exist yet. Synced folders (--publish) can
+    still upload them out of order; the shell's loader retries and then shows a banner.
+    """
+    pointer_path, hashed_pattern = get_data_file_paths(output_path)
+
+    # 1. Content-hashed data file (kept as-is if identical data was already published)
+    #    Streamed to a staging file first, since the hash is only known once written
+    staging_path = f"{pointer_path}.staging"
+    data_hash = write_text_file(staging_path, iter_data_script(data))[:12]
+    data_path = hashed_pattern.format(hash=data_hash)
+    if os.path.exists(data_path):
+        os.remove(staging_path)
+        print(f"Data file unchanged: {data_path}")
+    else:
+        os.replace(staging_path, data_path)
+        print(f"Data file written to: {data_path}")
+    print(f"Data file size: {os.path.getsize(data_path) / 1024:.1f} KB")
+
+    # 2. Pointer to the latest data file
+    data_url = quote(os.path.basename(data_path))
+    pointer_content = f"loadDashboardScript('{data_url}', false, false);\n"
+    write_text_file(pointer_path, pointer_content)
+    print(f"Data pointer written to: {pointer_path}")
+
+    # 3. Shell HTML - only rewritten when the template (or output name) changed
+    shell = build_shell(template, output_path)
+    validate_output(shell)
+    existing_shell = None
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            existing_shell = f.read()
+    if existing_shell == shell:
+        print(f"Shell unchanged: {output_path}")
+    else:
+        write_text_file(output_path, shell)
+        print(f"Shell written to: {output_path}")
+    print(f"Shell size: {os.path.getsize(output_path) / 1024 / 1024:.1f} MB")
+
+    # 4. Prune old data files, keeping the most recent few for viewers mid-load
+    old_data_files = sorted(
+        (p for p in glob.glob(glob.escape(hashed_pattern).replace('{hash}', '*')) if p != data_path),
+        key=os.path.getmtime,
+        reverse=True
+    )
+    for stale_path in old_data_files[DATA_FILES_TO_KEEP - 1:]:
+        os.remove(stale_path)
+
+
+def write_single_output(template, data, output_path):
+    """Write the single-file dashboard HTML with all data inlined.
+
+    The output is streamed placeholder by placeholder, so neither the JSON strings
+    nor the full HTML string are held in memory at once.
+    """
+    print("Replacing placeholders...")
+    replacements = {
+        'WORK_ITEMS_PLACEHOLDER': lambda: iter_json(data['workItems']),
+        'REFRESH_TIMESTAMP_PLACEHOLDER': lambda: [data['refreshTimestamp']],
+        'ORG_CHART_DATA_PLACEHOLDER': lambda: iter_json(data['orgChartData']),
+        'ORG_CHART_INDEX_PLACEHOLDER': lambda: iter_json(data['orgChartIndex']),
+        'CSV_VALIDATION_DATA_PLACEHOLDER': lambda: iter_json(data['csvValidationData']),
+        'WORK_ITEM_LINKS_PLACEHOLDER': lambda: iter_json(data['workItemLinks'])
+    }
+
+    # Validate placeholders replaced (everything outside the replaced spans must be placeholder-free)
+    validate_output(''.join(re.split('|'.join(map(re.escape, replacements)), template)))
+
+    # Write output
+    write_text_file(output_path, render_template(template, replacements))
+
+    file_size_mb = os.path.getsize(output_path) / 1024 / 1024
+    print(f"Dashboard written to: {output_path}")
+    print(f"File size: {file_size_mb:.1f} MB")
+
+    # Sanity check - v45 was ~5MB, if much smaller, data may be wrong
+    if file_size_mb < 3:
+        print("⚠ WARNING: Output file smaller than expected. Data may not have loaded correctly.")
+
+
+def find_first_difference(fast_items, pandas_items):
+    """Return a description of the first mismatch between two record lists, or None."""
+    if len(fast_items) != len(pandas_items):
+        return f"length {len(fast_items)} (fast) vs {len(pandas_items)} (pandas)"
+    for i, (fast_item, pandas_item) in enumerate(zip(fast_items, pandas_items)):
+        if fast_item != pandas_item:
+            if isinstance(fast_item, dict) and isinstance(pandas_item, dict):
+                keys = sorted(k for k in fast_item.keys() | pandas_item.keys() if fast_item.get(k) != pandas_item.get(k))
+                fields = ', '.join(f"{k}: {fast_item.get(k)!r} vs {pandas_item.get(k)!r}" for k in keys[:5])
+                return f"record {i}: {fields}"
+            return f"item {i}: {fast_item!r} vs {pandas_item!r}"
+    return None
+
+
+def compare_paths(label, csv_path, links_csv_path, org_chart_path):
+    """Run the fast and pandas paths on the same input files, print timings and differences.
+
+    The fast path runs first so its timing never benefits from pandas being imported.
+    Returns the number of outputs (work items, links, org chart) that differ.
+    """
+    print(f"Benchmark [{label}]: fast path (csv module)...")
+    start = time.perf_counter()
+    fast_results = {
+        'Work items': list(process_csv_fast(csv_path)),
+        'Work item links': process_work_item_links_fast(links_csv_path),
+        'Org chart': process_org_chart_fast(org_chart_path),
+    }
+    fast_time = time.perf_counter() - start
+
+    print(f"Benchmark [{label}]: pandas path...")
+    pandas_imported = 'pandas' in sys.modules
+    start = time.perf_counter()
+    import pandas  # Imported here (not at the top) to time the import
+    import_time = time.perf_counter() - start
+    pandas_results = {
+        'Work items': list(process_csv(csv_path)),
+        'Work item links': process_work_item_links(links_csv_path),
+        'Org chart': process_org_chart(org_chart_path),
+    }
+    pandas_time = time.perf_counter() - start
+
+    print("=" * 60)
+    print(label)
+    print("-" * 60)
+    print(f"pandas version:    {pandas.__version__:>8}")
+    print(f"pandas import:     {import_time * 1000:8.0f} ms{' (already imported)' if pandas_imported else ''}")
+    print(f"pandas path total: {pandas_time * 1000:8.0f} ms (including import)")
+    print(f"fast path total:   {fast_time * 1000:8.0f} ms")
+    if fast_time > 0:
+        print(f"Speedup:           {pandas_time / fast_time:8.1f}x")
+    print("-" * 60)
+
+    mismatches = 0
+    for name, fast_output in fast_results.items():
+        pandas_output = pandas_results[name]
+        if name == 'Org chart':
+            difference = (find_first_difference(fast_output[0], pandas_output[0])
+                          or (None if fast_output[1] == pandas_output[1] else "orgChartIndex differs"))
+        else:
+            difference = find_first_difference(fast_output, pandas_output)
+        if difference:
+            mismatches += 1
+            print(f"✗ {name}: {difference}")
+        else:
+            print(f"✓ {name}: identical ({len(fast_output[0]) if name == 'Org chart' else len(fast_output)} records)")
+    print("=" * 60)
+    return mismatches
+
+
+def run_benchmark(csv_path, links_csv_path, org_chart_path):
+    """Time the fast (csv module) path against the pandas path and compare their output.
+
+    Always compares both paths on synthetic work items in both column formats (System.*
+    and legacy friendly names) with edge values, plus synthetic links and org chart, so
+    no input files are needed. The input CSVs are compared first if they exist.
+    Exits with status 1 if any work item, link or org chart record differs.
+    """
+    mismatches = 0
+    if os.path.exists(csv_path):
+        mismatches += compare_paths('Input CSVs', csv_path, links_csv_path, org_chart_path)
+    else:
+        print(f"Input CSV not found, comparing synthetic data only: {csv_path}")
+
+    work_dir = tempfile.mkdtemp(prefix='dashboard-benchmark-')
+    try:
+        synthetic_links_path = os.path.join(work_dir, 'WorkItemLinks.csv')
+        synthetic_org_chart_path = os.path.join(work_dir, 'Org Chart.csv')
+        write_synthetic_links_csv(synthetic_links_path, BENCHMARK_ITEMS)
+        write_synthetic_org_chart_csv(synthetic_org_chart_path)
+        for legacy in (False, True):
+            column_format = 'legacy' if legacy else 'System.*'
+            synthetic_csv_path = os.path.join(work_dir, f'ALL Items ({column_format}).csv')
+            write_synthetic_csv(synthetic_csv_path, BENCHMARK_ITEMS, legacy=legacy, edge_values=True)
+            mismatches += compare_paths(
+                f'Synthetic, {BENCHMARK_ITEMS:,} work items, {column_format} columns + edge values',
+                synthetic_csv_path, synthetic_links_path, synthetic_org_chart_path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if mismatches:
+        print(f"✗ Fast and pandas paths differ ({mismatches} outputs)")
+        sys.exit(1)
+    print("✓ Fast and pandas paths produce identical records")
+
+
+# Edge values for write_synthetic_csv(edge_values=True), cycled per row. Values are chosen per
+# column, since dtype inference is per column: each list makes its whole column one case.
+SYNTHETIC_EDGE_VALUES = {
+    # Strings: pandas NA strings, blanks, quoted commas/quotes/newlines, padding, '</script>'
+    'System.Title': ['Item, with "quotes", commas', 'Item\nwith a second line', 'NA', '',
+                     '  padded title  ', 'Item </script>', 'null'],
+    'Custom.Customers': ['Acme, Inc.', 'Globex\r\nGR', 'n/a', '#N/A', ' ', 'None', 'NaN', 'nan'],
+    'Custom.Component': ['Portal', '-nan', '<NA>', 'NULL', ''],
+    # Numeric strings: "3.10" reads as 3.1, ints with a missing value become floats
+    'Custom.ReleaseVersion': ['3.10', '3.9', '', '4.0'],
+    'Custom.Feature': ['1', '2', 'NA'],
+    # Booleans (case-insensitive): all present -> bool, with missing values -> object
+    'Custom.TeamsAffected': ['true', 'False', ''],
+    'Custom.BugType': ['True', 'false', 'TRUE'],
+    'Custom.EffortRollup': ['true', 'FALSE'],
+    # Floats with whitespace padding and infinities, ints with whitespace padding
+    'Microsoft.VSTS.Scheduling.Effort': [' 1.5 ', 'inf', '2', '', '-Infinity', '1e3'],
+    'Microsoft.VSTS.Common.Priority': [' 2', '3 ', '\t1', '4'],
+}
+
+
+def write_synthetic_csv(csv_path, item_count, legacy=False, edge_values=False):
+    """Write a deterministic synthetic ALL Items CSV for --memory-check and --benchmark.
+
+    Rows are streamed to disk; values cycle through small vocabularies like a real export
+    (few types/states/teams, many repeated names and dates), titles and IDs are unique.
+    legacy=True writes the legacy friendly column names (and legacy date format) instead
+    of System.* names. edge_values=True mixes in SYNTHETIC_EDGE_VALUES.
+    """
+    teams = ['Frontend (US)', 'Frontend (GR)', 'Backend', 'QA', 'DevOps', 'Analytics', 'Govern', 'SCG']
+    people = [f'Engineer {i} <engineer{i}@e-share.us>' for i in range(60)]
+    header = list(dict.fromkeys(names[0] for _, _, names in WORK_ITEM_SCHEMA))
+    legacy_names = {names[0]: names[1] for _, _, names in WORK_ITEM_SCHEMA}
+
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([legacy_names[name] for name in header] if legacy else header)
+        for i in range(1, item_count + 1):
+            day = f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}"
+            if legacy:
+                created = f"{i % 12 + 1}/{i % 28 + 1}/2025 {i % 12 + 1}:{i % 60:02d}:{i % 59:02d} {'AM' if i % 2 else 'PM'}"
+            else:
+                created = f'{day}T{i % 24:02d}:{i % 60:02d}:{i % 59:02d}.{i % 100}Z'
+            values = {
+                'System.Id': i,
+                'System.WorkItemType': ['Bug', 'Task', 'Feature', 'Issue', 'Delivery Slice'][i % 5],
+                'System.Title': f'Synthetic work item {i}',
+                'System.State': ['New', 'Triaged', 'In Progress', 'Done', 'Closed'][i % 5],
+                'System.AssignedTo': people[i % len(people)] if i % 7 else '',
+                'System.AreaPath': f'eShare\\{teams[i % len(teams)]}',
+                'System.IterationPath': f'eShare\\CY2025Q{i % 4 + 1}',
+                'System.CreatedDate': created,
+                'Microsoft.VSTS.Common.StateChangeDate': f'{day}T{(i + 5) % 24:02d}:{i % 60:02d}:00Z',
+                'Microsoft.VSTS.Common.ClosedDate': f'{day}T21:00:00Z' if i % 3 == 0 else '',
+                'Microsoft.VSTS.Scheduling.TargetDate': f'{day}T21:00:00Z' if i % 4 == 0 else '',
+                'Microsoft.VSTS.Common.Priority': i % 4 + 1,
+                'Microsoft.VSTS.Common.Severity': ['1 - Critical', '2 - High', '3 - Medium', ''][i % 4],
+                'System.Tags': ['Candidate', 'CS: High Value', 'UI: Portal; CWP: Cloud Provider', ''][i % 4],
+                'System.Parent': i // 10 or '',
+                'Microsoft.VSTS.Scheduling.Effort': (i % 8) / 2 or '',
+                'Custom.EffortRollup': (i % 16) / 2,
+                'Microsoft.VSTS.Common.BacklogPriority': i * 1000.5,
+                'Custom.Customers': ['Acme', 'Globex', 'Initech', ''][i % 4],
+                'Custom.ReleaseVersion': ['6.4.0', '6.5.0', '7.0.0', ''][i % 4],
+                'Custom.BugType': ['Customer Bug', 'Internal Bug', ''][i % 3],
+                'Custom.TicketCategory': ['Enhancement Request', 'Question', ''][i % 3],
+                'Custom.DeliverySliceOwner': people[(i * 7) % len(people)] if i % 5 == 0 else '',
+            }
+            if edge_values:
+                values.update((name, edge[i % len(edge)]) for name, edge in SYNTHETIC_EDGE_VALUES.items())
+                # 17 significant digits, only round-trips exactly with float_precision='round_trip'
+                values['Microsoft.VSTS.Common.BacklogPriority'] = repr(i * 1234.5678901234567)
+            writer.writerow([values.get(name, '') for name in header])
+
+
+def write_synthetic_links_csv(csv_path, item_count):
+    """Write a deterministic synthetic WorkItemLinks CSV (forward + reverse links) for --benchmark."""
+    header = ['WorkItemLinkSK', 'SourceWorkItemId', 'TargetWorkItemId', 'CreatedDate', 'DeletedDate',
+              'Comment', 'LinkTypeId', 'LinkTypeReferenceName', 'LinkTypeName', 'LinkTypeIsAcyclic',
+              'LinkTypeIsDirectional', 'AnalyticsUpdatedDate', 'ProjectSK']
+    link_types = [(2, 'System.LinkTypes.Hierarchy', 'Child', 'True'),
+                  (1, 'System.LinkTypes.Related', 'Related', 'False'),
+                  (3, 'System.LinkTypes.Dependency', '', 'True')]
+    comments = ['', 'mentioned in standup', 'blocks, see "notes"', 'line one\nline two', 'NA']
+
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(2, item_count + 1):
+            type_id, reference_name, name, acyclic = link_types[i % len(link_types)]
+            source, target = i // 2, i if i % 50 else ''
+            for direction in (1, -1):  # forward and reverse row, like the Analytics export
+                writer.writerow([
+                    i * direction, source if direction > 0 else target, target if direction > 0 else source,
+                    f'2025-{i % 12 + 1:02d}-01T10:00:00Z', '', comments[i % len(comments)],
+                    type_id * direction, f"{reference_name}-{'Forward' if direction > 0 else 'Reverse'}",
+                    name, acyclic, 'true', '2025-10-01T00:00:00Z', 'ab12-cd34'
+                ])
+
+
+def write_synthetic_org_chart_csv(csv_path):
+    """Write a small synthetic Org Chart CSV for --benchmark.
+
+    Covers a multi-team lead, region suffixes, former members, missing common names and
+    statuses, NA strings, padding and a lead without members.
+    """
+    rows = [
+        ['Maya Dahan', 'Alice Alpha', 'Alice', 'Analytics', 'Employed'],
+        ['Maya Dahan', 'Bob Beta', '', 'Analytics', ''],
+        ['Maya Dahan', 'Carl Gamma', 'Carl', 'Analytics', 'Former'],
+        ['Maya Dahan', 'Dana Delta', 'Dana', 'Govern', 'N/A'],
+        [' Jane Lead ', 'Eve Epsilon <eve@e-share.us>', ' Eve ', 'Frontend (US)', 'Employed'],
+        [' Jane Lead ', 'Fay Zeta', 'Fay', 'Frontend (GR)', 'Contractor'],
+        ['Jane Lead', 'Gus Eta', 'Gus', 'NA', 'Employed'],
+        ['Solo Lead', '', '', '', ''],
+        ['', 'No Lead', 'No Lead', 'QA', 'Employed'],
+    ]
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(ORG_CHART_COLUMNS)
+        writer.writerows(rows)
+
+
+def get_peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (macOS and Linux)."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes on Linux
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_memory_check(template_dir, fast, split=False):
+    """Peak-memory budget check: full run over MEMORY_CHECK_ITEMS synthetic items.
+
+    Generates the synthetic CSV in a temp folder, processes it, builds validation data,
+    validates the schema and writes the dashboard (single file, or shell + data file with
+    split=True), then compares peak RSS with MEMORY_BUDGET_MB for the selected path.
+    The same budget applies to both output modes. Exits with status 1 if over budget.
+    """
+    path_name = 'fast' if fast else 'pandas'
+    output_mode = 'split' if split else 'single file'
+    budget_mb = MEMORY_BUDGET_MB[path_name]
+    work_dir = tempfile.mkdtemp(prefix='dashboard-memory-check-')
+    try:
+        csv_path = os.path.join(work_dir, 'ALL Items.csv')
+        print(f"Memory check: writing {MEMORY_CHECK_ITEMS:,} synthetic work items...")
+        write_synthetic_csv(csv_path, MEMORY_CHECK_ITEMS)
+        print(f"Synthetic CSV size: {os.path.getsize(csv_path) / 1024 / 1024:.1f} MB")
+
+        template = build_template(template_dir)
+        start_rss = get_peak_rss_mb()
+        start = time.perf_counter()
+
+        records = process_csv_fast(csv_path) if fast else process_csv(csv_path)
+        csv_validation_data = generate_csv_validation_data(records)
+        validate_schema(records)
+        data = {
+            'workItems': records,
+            'workItemLinks': [],
+            'orgChartData': [],
+            'orgChartIndex': build_org_chart_index([], {}),
+            'csvValidationData': csv_validation_data,
+            'refreshTimestamp': get_refresh_timestamp(csv_path)
+        }
+        output_path = os.path.join(work_dir, 'dashboard.html')
+        if split:
+            write_split_output(template, data, output_path)
+        else:
+            write_single_output(template, data, output_path)
+
+        elapsed = time.perf_counter() - start
+        peak_rss = get_peak_rss_mb()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("=" * 60)
+    print(f"Path:              {path_name}")
+    print(f"Output:            {output_mode}")
+    print(f"Work items:        {MEMORY_CHECK_ITEMS:,}")
+    print(f"Run time:          {elapsed:.1f} s")
+    print(f"Peak RSS at start: {start_rss:8.0f} MB (interpreter + template)")
+    print(f"Peak RSS:          {peak_rss:8.0f} MB (budget: {budget_mb} MB)")
+    print("=" * 60)
+    if peak_rss > budget_mb:
+        print(f"✗ Peak memory over budget by {peak_rss - budget_mb:.0f} MB")
+        sys.exit(1)
+    print("✓ Peak memory within budget")
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -626,6 +1538,22 @@ Examples:
                         action='store_true',
                         help=f"Publish to SharePoint instead of local directory")
 
+    parser.add_argument('-s', '--split',
+                        action='store_true',
+                        help="Write a stable shell HTML plus a separate, content-hashed data file (browsers cache the shell)")
+
+    parser.add_argument('-f', '--fast',
+                        action='store_true',
+                        help="Fast start: read CSVs with the standard library csv module instead of pandas")
+
+    parser.add_argument('--benchmark',
+                        action='store_true',
+                        help="Time the fast path against the pandas path, compare records on synthetic data (both column formats) and the input CSVs if present, and exit (no output written)")
+
+    parser.add_argument('--memory-check',
+                        action='store_true',
+                        help=f"Check peak memory against the documented budget with {MEMORY_CHECK_ITEMS:,} synthetic work items (use with --fast / --split to check the fast path / split output)")
+
     return parser.parse_args()
 
 
@@ -640,6 +1568,11 @@ def main():
         output_path = os.path.expanduser(args.output)
         mode = "LOCAL" if output_path == LOCAL_OUTPUT_PATH else "CUSTOM"
 
+    if args.split:
+        mode += " + SPLIT"
+    if args.fast:
+        mode += " + FAST"
+
     print("=" * 60)
     print(f"eShare Dashboard Generator v{CURRENT_VERSION} [{mode}]")
     print("=" * 60)
@@ -650,11 +1583,26 @@ def main():
     links_csv_path = os.path.expanduser(args.links)
     template_dir = os.path.expanduser(args.templates)
 
+    # Memory check uses synthetic data, no input CSVs needed
+    if args.memory_check:
+        run_memory_check(template_dir, args.fast, args.split)
+        return
+
+    # Benchmark always compares synthetic data, the input CSVs only if present
+    if args.benchmark:
+        run_benchmark(csv_path, links_csv_path, org_chart_path)
+        return
+
     # Check CSV exists
     if not os.path.exists(csv_path):
         print(f"ERROR: CSV file not found: {csv_path}")
         sys.exit(1)
 
+    # Check Org Chart exists - the org chart and team capacity views are built from it
+    if not os.path.exists(org_chart_path):
+        print(f"ERROR: Org chart CSV not found: {org_chart_path}")
+        sys.exit(1)
+
     # Print configuration
     print(f"CSV file:      {csv_path}")
     print(f"Org Chart:     {org_chart_path}")
@@ -662,13 +1610,21 @@ def main():
     print(f"Templates:     {template_dir}")
     print(f"Output:        {output_path}")
     print("-" * 60)
+
+    # Fast path reads CSVs with the csv module and never imports pandas
+    if args.fast:
+        process_csv_fn, process_org_chart_fn, process_links_fn = (
+            process_csv_fast, process_org_chart_fast, process_work_item_links_fast)
+    else:
+        process_csv_fn, process_org_chart_fn, process_links_fn = (
+            process_csv, process_org_chart, process_work_item_links)
     
     # Get refresh timestamp (from CSV file's last modified date)
     refresh_timestamp = get_refresh_timestamp(csv_path)
     print(f"Refresh timestamp: {refresh_timestamp}")
     
     # Process CSV
-    records = process_csv(csv_path)
+    records = process_csv_fn(csv_path)
     print(f"Processed {len(records)} work items")
 
     # Generate CSV validation data
@@ -676,11 +1632,14 @@ def main():
     print(f"Generated validation metadata (total: {csv_validation_data['total']}, types: {len(csv_validation_data['byType'])}, states: {len(csv_validation_data['byState'])}, teams: {len(csv_validation_data['byTeam'])})")
 
     # Process Org Chart
-    org_chart_data = process_org_chart(org_chart_path)
-    print(f"Processed {len(org_chart_data)} org chart entries")
+    org_chart_data, org_chart_index = process_org_chart_fn(org_chart_path)
+    if not org_chart_data:
+        print(f"ERROR: No team leads found in org chart CSV: {org_chart_path}")
+        sys.exit(1)
+    print(f"Processed {len(org_chart_data)} org chart entries ({len(org_chart_index['teams'])} teams, {len(org_chart_index['members'])} people, {len(org_chart_index['aliases'])} name aliases)")
 
     # Process Work Item Links
-    work_item_links = process_work_item_links(links_csv_path)
+    work_item_links = process_links_fn(links_csv_path)
     print(f"Processed {len(work_item_links)} work item links")
 
     # Validate schema
@@ -691,41 +1650,27 @@ def main():
     template = build_template(template_dir)
     print(f"Template size: {len(template):,} chars")
 
-    # Replace placeholders
-    print("Replacing placeholders...")
-    json_data = json.dumps(records, indent=None)
-    org_chart_json = json.dumps(org_chart_data, indent=None)
-    csv_validation_json = json.dumps(csv_validation_data, indent=None)
-    work_item_links_json = json.dumps(work_item_links, indent=None)
-    print(f"JSON data size: {len(json_data):,} chars")
-    print(f"Links data size: {len(work_item_links_json):,} chars")
-
-    output = template.replace('WORK_ITEMS_PLACEHOLDER', json_data)
-    output = output.replace('REFRESH_TIMESTAMP_PLACEHOLDER', refresh_timestamp)
-    output = output.replace('ORG_CHART_DATA_PLACEHOLDER', org_chart_json)
-    output = output.replace('CSV_VALIDATION_DATA_PLACEHOLDER', csv_validation_json)
-    output = output.replace('WORK_ITEM_LINKS_PLACEHOLDER', work_item_links_json)
-    
-    # Validate placeholders replaced
-    validate_output(output)
-    
     # Create output directory if needed
     output_dir = os.path.dirname(output_path)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
-    
-    # Write output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(output)
-    
-    file_size_mb = os.path.getsize(output_path) / 1024 / 1024
-    print(f"Dashboard written to: {output_path}")
-    print(f"File size: {file_size_mb:.1f} MB")
-    
-    # Sanity check - v45 was ~5MB, if much smaller, data may be wrong
-    if file_size_mb < 3:
-        print("⚠ WARNING: Output file smaller than expected. Data may not have loaded correctly.")
-    
+
+    data = {
+        'workItems': records,
+        'workItemLinks': work_item_links,
+        'orgChartData': org_chart_data,
+        'orgChartIndex': org_chart_index,
+        'csvValidationData': csv_validation_data,
+        'refreshTimestamp': refresh_timestamp
+    }
+
+    if args.split:
+        # Split mode: stable shell + small content-hashed data file
+        print("Writing split output (shell + data file)...")
+        write_split_output(template, data, output_path)
+    else:
+        write_single_output(template, data, output_path)
+
     print("=" * 60)
     print("SUCCESS!")
     print("=" * 60)